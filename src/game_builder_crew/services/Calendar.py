@@ -1,6 +1,11 @@
 import datetime
+from zoneinfo import ZoneInfoNotFoundError
 from crewai.tools import tool
-from game_builder_crew.shared.models import Appointment, APPOINTMENTS_BY_DATE
+from game_builder_crew.shared.models import Appointment, APPOINTMENTS_BY_DATE, CALENDAR_CONFIG
+from game_builder_crew.utils.time_grid import (
+    find_open_slots, from_minutes, get_window_table, is_aligned, local_formatter,
+    storage_dates, to_minutes
+)
 from game_builder_crew.utils.schedule_generator import create_very_busy_schedule_config, generate_random_schedule, create_busy_schedule_config
 
 
@@ -48,58 +53,87 @@ def get_all_appointments():
     """Get all appointments across all dates."""
     return list(APPOINTMENTS_BY_DATE.values())
 
+def _appointment_minutes(appointment: Appointment):
+    """Get an appointment's (start, end) in UTC minutes, caching them on first use."""
+    if appointment.start_minute is None or appointment.end_minute is None:
+        appointment.start_minute = to_minutes(appointment.start_time, CALENDAR_CONFIG.timezone)
+        appointment.end_minute = to_minutes(appointment.end_time, CALENDAR_CONFIG.timezone)
+    return appointment.start_minute, appointment.end_minute
+
+
+def _busy_intervals(start: int, end: int):
+    """Get the sorted (start, end) UTC minute intervals of appointments stored on the dates spanning [start, end]."""
+    busy = []
+    for day in storage_dates(start, end):
+        for appointment in APPOINTMENTS_BY_DATE.get(day, []):
+            busy.append(_appointment_minutes(appointment) + (appointment,))
+    busy.sort(key=lambda interval: interval[:2])
+    return busy
+
+
+def _attendee_hours(attendees: list[str]):
+    """
+    Get the working hours that apply to a meeting's attendees.
+    When any attendee has their own consultant_hours, only those are checked
+    (clients follow the consultant, as in get_open_meeting_slots); otherwise
+    the business hours apply.
+    """
+    checks = [(name, CALENDAR_CONFIG.consultant_hours[name])
+              for name in attendees if name in CALENDAR_CONFIG.consultant_hours]
+    return checks or [(None, CALENDAR_CONFIG.business_hours)]
+
+
 @tool
-def get_open_meeting_slots(date: str, duration_minutes: int = 60):
+def get_open_meeting_slots(date: str, duration_minutes: int = 60, consultant: str = None, timezone: str = None):
     """
     Get available meeting slots for a specific date.
     
     Args:
-        date: Date in YYYY-MM-DD format
+        date: Date in YYYY-MM-DD format, in the consultant's local timezone
         duration_minutes: Duration of the meeting in minutes (default 60)
+        consultant: Optional consultant name whose working hours to use (default business hours)
+        timezone: Optional IANA timezone name to report slot times in (default the consultant's timezone)
     
     Returns:
-        List of available time slots as dictionaries with start_time and end_time
+        List of available time slots as dictionaries with start_time, end_time and the
+        timezone they are expressed in (pass it on to set_meeting)
     """
     try:
         target_date = datetime.datetime.strptime(date, "%Y-%m-%d").date()
     except ValueError:
         return {"error": "Invalid date format. Please use YYYY-MM-DD format."}
     
-    # Business hours: 9 AM to 5 PM
-    business_start = 9
-    business_end = 17
-    
-    # Get existing appointments for the date
-    existing_appointments = APPOINTMENTS_BY_DATE.get(target_date, [])
-    
-    # Generate all possible time slots
-    available_slots = []
-    current_time = datetime.datetime.combine(target_date, datetime.time(business_start, 0))
-    end_of_day = datetime.datetime.combine(target_date, datetime.time(business_end, 0))
-    
-    while current_time + datetime.timedelta(minutes=duration_minutes) <= end_of_day:
-        slot_end = current_time + datetime.timedelta(minutes=duration_minutes)
-        
-        # Check if this slot conflicts with any existing appointment
-        is_available = True
-        for appointment in existing_appointments:
-            if (current_time < appointment.end_time and slot_end > appointment.start_time):
-                is_available = False
-                break
-        
-        if is_available:
-            available_slots.append({
-                "start_time": current_time.strftime("%Y-%m-%d %H:%M"),
-                "end_time": slot_end.strftime("%Y-%m-%d %H:%M")
-            })
-        
-        # Move to next 30-minute slot
-        current_time += datetime.timedelta(minutes=30)
-    
-    return available_slots
+    hours = CALENDAR_CONFIG.hours_for(consultant)
+    output_tz = timezone or hours.timezone
+    try:
+        table = get_window_table(hours.timezone, hours.start_minute, hours.end_minute)
+        window = table.window(target_date)
+        # The table already knows the window's offsets; other timezones need a lookup
+        if output_tz == hours.timezone:
+            format_local = window.formatter()
+        else:
+            format_local = local_formatter(window.start, window.end, output_tz)
+    except ZoneInfoNotFoundError:
+        return {"error": f"Unknown timezone: {output_tz}."}
+    
+    # Busy intervals for the window, as integer UTC minutes
+    busy = [interval[:2] for interval in _busy_intervals(window.start, window.end)]
+    starts = find_open_slots(
+        window.start, window.end, busy, duration_minutes, CALENDAR_CONFIG.slot_granularity_minutes
+    )
+    
+    return [
+        {
+            "start_time": format_local(start),
+            "end_time": format_local(start + duration_minutes),
+            "timezone": output_tz
+        }
+        for start in starts
+    ]
 
 @tool
-def set_meeting(title: str, start_time: str, end_time: str, description: str, attendees: list[str]):
+def set_meeting(title: str, start_time: str, end_time: str, description: str, attendees: list[str],
+                timezone: str = None):
     """
     Schedule a new meeting appointment.
     
@@ -109,6 +143,9 @@ def set_meeting(title: str, start_time: str, end_time: str, description: str, at
         end_time: End time in YYYY-MM-DD HH:MM format
         description: Meeting description
         attendees: List of attendee names
+        timezone: Optional IANA timezone name the times are given in (default the timezone of the
+            first attendee with their own working hours, otherwise the business hours timezone,
+            matching what get_open_meeting_slots returns)
     
     Returns:
         Success message or error if scheduling fails
@@ -119,31 +156,54 @@ def set_meeting(title: str, start_time: str, end_time: str, description: str, at
     except ValueError:
         return {"error": "Invalid datetime format. Please use YYYY-MM-DD HH:MM format."}
     
-    if start_dt >= end_dt:
-        return {"error": "End time must be after start time."}
+    checks = _attendee_hours(attendees)
+    input_tz = timezone or checks[0][1].timezone
+    try:
+        start = to_minutes(start_dt, input_tz)
+        end = to_minutes(end_dt, input_tz)
+    except ZoneInfoNotFoundError:
+        return {"error": f"Unknown timezone: {input_tz}."}
     
-    # Check business hours (9 AM to 5 PM)
-    if start_dt.hour < 9 or end_dt.hour > 17:
-        return {"error": "Meetings can only be scheduled between 9 AM and 5 PM."}
+    if start >= end:
+        return {"error": "End time must be after start time."}
     
-    meeting_date = start_dt.date()
+    # Check the working hours of every attendee; the start must lie on the slot grid of
+    # at least one of their windows, as offered by get_open_meeting_slots
+    step = CALENDAR_CONFIG.slot_granularity_minutes
+    on_grid = False
+    for name, hours in checks:
+        table = get_window_table(hours.timezone, hours.start_minute, hours.end_minute)
+        local_date = from_minutes(start, hours.timezone).date()
+        window = table.window(local_date)
+        if start < window.start or end > window.end:
+            who = f" for {name}" if name else ""
+            return {
+                "error": f"Meetings can only be scheduled between {hours.start_hour:02d}:00 and "
+                         f"{hours.end_hour:02d}:00 ({hours.timezone}){who}."
+            }
+        on_grid = on_grid or is_aligned(start, window.start, step)
+    if not on_grid:
+        return {"error": f"Meetings must start on the {step}-minute grid."}
     
     # Check for conflicts with existing appointments
-    existing_appointments = APPOINTMENTS_BY_DATE.get(meeting_date, [])
-    for appointment in existing_appointments:
-        if (start_dt < appointment.end_time and end_dt > appointment.start_time):
+    for busy_start, busy_end, appointment in _busy_intervals(start, end):
+        if start < busy_end and end > busy_start:
             return {
                 "error": f"Time slot conflicts with existing appointment: {appointment.title} ({appointment.start_time.strftime('%H:%M')} - {appointment.end_time.strftime('%H:%M')})"
             }
     
-    # Create new appointment
+    # Create new appointment, stored in the calendar timezone
+    storage_start = from_minutes(start, CALENDAR_CONFIG.timezone)
     new_appointment = Appointment(
         title=title,
-        start_time=start_dt,
-        end_time=end_dt,
+        start_time=storage_start,
+        end_time=from_minutes(end, CALENDAR_CONFIG.timezone),
         description=description,
-        attendees=attendees
+        attendees=attendees,
+        start_minute=start,
+        end_minute=end
     )
+    meeting_date = storage_start.date()
     
     # Add to calendar
     if meeting_date not in APPOINTMENTS_BY_DATE:
@@ -159,7 +219,7 @@ def set_meeting(title: str, start_time: str, end_time: str, description: str, at
             "start_time": start_time,
             "end_time": end_time,
             "description": description,
-            "attendees": attendees
+            "attendees": attendees,
+            "timezone": input_tz
         }
     }
-    
\ No newline at end of file
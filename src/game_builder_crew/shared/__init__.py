@@ -2,6 +2,20 @@
 Shared module for common data structures and utilities.
 """
 
-from .models import Appointment, ScheduleConfig, APPOINTMENTS_BY_DATE
+from .models import (
+    Appointment,
+    WorkingHours,
+    CalendarConfig,
+    ScheduleConfig,
+    CALENDAR_CONFIG,
+    APPOINTMENTS_BY_DATE
+)
 
-__all__ = ['Appointment', 'ScheduleConfig', 'APPOINTMENTS_BY_DATE']
+__all__ = [
+    'Appointment',
+    'WorkingHours',
+    'CalendarConfig',
+    'ScheduleConfig',
+    'CALENDAR_CONFIG',
+    'APPOINTMENTS_BY_DATE'
+]
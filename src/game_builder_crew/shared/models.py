@@ -3,9 +3,21 @@ Shared data models used across the application.
 This module contains common data structures to avoid circular imports.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+
+def _validate_hours(start_hour: int, end_hour: int):
+    """Check that a daily working window lies within a day and is not empty."""
+    if not 0 <= start_hour < end_hour <= 24:
+        raise ValueError("Working hours must satisfy 0 <= start_hour < end_hour <= 24.")
+
+
+def _validate_granularity(granularity_minutes: int):
+    """Check that a slot step tiles a day evenly."""
+    if granularity_minutes <= 0 or (24 * 60) % granularity_minutes:
+        raise ValueError("slot_granularity_minutes must be a positive divisor of 1440.")
 
 
 @dataclass
@@ -16,6 +28,56 @@ class Appointment:
     end_time: datetime.datetime
     description: str
     attendees: List[str]
+    
+    # Start and end as UTC minutes from the epoch, cached when the appointment is created
+    start_minute: Optional[int] = field(default=None, repr=False, compare=False)
+    end_minute: Optional[int] = field(default=None, repr=False, compare=False)
+
+
+@dataclass
+class WorkingHours:
+    """Daily working window, expressed in local hours of the given timezone."""
+    timezone: str = "UTC"
+    start_hour: int = 9
+    end_hour: int = 17
+
+    def __post_init__(self):
+        _validate_hours(self.start_hour, self.end_hour)
+
+    @property
+    def start_minute(self) -> int:
+        return self.start_hour * 60
+
+    @property
+    def end_minute(self) -> int:
+        return self.end_hour * 60
+
+
+@dataclass
+class CalendarConfig:
+    """Calendar-wide scheduling settings shared by the calendar tools and the schedule generator."""
+    # Timezone that naive appointment datetimes (and APPOINTMENTS_BY_DATE keys) are stored in
+    timezone: str = "UTC"
+    
+    # Step between candidate meeting start times (in minutes), e.g. 5, 15 or 30
+    slot_granularity_minutes: int = 30
+    
+    # Default working hours, used for anyone without an entry in consultant_hours
+    business_hours: Optional[WorkingHours] = None
+    
+    # Per-consultant working hours, keyed by consultant name
+    consultant_hours: Dict[str, WorkingHours] = None
+    
+    def __post_init__(self):
+        _validate_granularity(self.slot_granularity_minutes)
+        if self.business_hours is None:
+            self.business_hours = WorkingHours(timezone=self.timezone)
+        if self.consultant_hours is None:
+            self.consultant_hours = {}
+    
+    def hours_for(self, consultant: Optional[str] = None) -> WorkingHours:
+        """Get the working hours for a consultant, falling back to the business hours."""
+        return self.consultant_hours.get(consultant, self.business_hours)
 
 
 @dataclass
@@ -28,9 +90,12 @@ class ScheduleConfig:
     min_meetings_per_day: int = 1
     max_meetings_per_day: int = 4
     
-    # Business hours
-    business_start_hour: int = 9
-    business_end_hour: int = 17
+    # Business hours, their timezone and slot step
+    # (default to a snapshot of the calendar-wide settings taken when the config is built)
+    business_start_hour: Optional[int] = None
+    business_end_hour: Optional[int] = None
+    business_timezone: Optional[str] = None
+    slot_granularity_minutes: Optional[int] = None
     
     # Meeting duration options (in minutes)
     meeting_durations: List[int] = None
@@ -44,7 +109,21 @@ class ScheduleConfig:
     def __post_init__(self):
         if self.meeting_durations is None:
             self.meeting_durations = [30, 60, 90, 120]
+        business_hours = CALENDAR_CONFIG.business_hours
+        if self.business_start_hour is None:
+            self.business_start_hour = business_hours.start_hour
+        if self.business_end_hour is None:
+            self.business_end_hour = business_hours.end_hour
+        if self.business_timezone is None:
+            self.business_timezone = business_hours.timezone
+        if self.slot_granularity_minutes is None:
+            self.slot_granularity_minutes = CALENDAR_CONFIG.slot_granularity_minutes
+        _validate_hours(self.business_start_hour, self.business_end_hour)
+        _validate_granularity(self.slot_granularity_minutes)
+
 
+# Global calendar settings
+CALENDAR_CONFIG = CalendarConfig()
 
 # Global appointments storage
 APPOINTMENTS_BY_DATE: Dict[datetime.date, List[Appointment]] = {}
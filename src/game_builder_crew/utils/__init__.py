@@ -8,10 +8,18 @@ from .schedule_generator import (
     create_busy_schedule_config,
     create_light_schedule_config
 )
+from .time_grid import (
+    WorkingWindowTable,
+    get_window_table,
+    find_open_slots
+)
 
 __all__ = [
     'RandomScheduleGenerator',
     'generate_random_schedule', 
     'create_busy_schedule_config',
-    'create_light_schedule_config'
+    'create_light_schedule_config',
+    'WorkingWindowTable',
+    'get_window_table',
+    'find_open_slots'
 ]
\ No newline at end of file
@@ -6,7 +6,8 @@ Generates realistic schedules with varying availability between date ranges.
 import random
 import datetime
 from typing import List, Dict
-from game_builder_crew.shared.models import Appointment, ScheduleConfig, APPOINTMENTS_BY_DATE
+from game_builder_crew.shared.models import Appointment, ScheduleConfig, APPOINTMENTS_BY_DATE, CALENDAR_CONFIG
+from game_builder_crew.utils.time_grid import WorkingWindowTable, from_minutes, get_window_table
 
 
 class RandomScheduleGenerator:
@@ -69,16 +70,22 @@ class RandomScheduleGenerator:
         else:  # heavy
             return random.randint(3, 4)
 
+    def _window_table(self) -> WorkingWindowTable:
+        """Get the working-window table for the configured business hours."""
+        return get_window_table(
+            self.config.business_timezone,
+            self.config.business_start_hour * 60,
+            self.config.business_end_hour * 60
+        )
+
     def _generate_meeting_time_slots(self, date: datetime.date, num_meetings: int) -> List[tuple]:
-        """Generate non-overlapping time slots for meetings on a given date."""
+        """Generate non-overlapping (start, end) time slots, in UTC minutes, for meetings on a given date."""
         slots = []
-        business_minutes = (self.config.business_end_hour - self.config.business_start_hour) * 60
+        window = self._window_table().window(date)
+        window_open, window_close = window.start, window.end
         
-        # Create potential start times (every 30 minutes)
-        potential_starts = []
-        for hour in range(self.config.business_start_hour, self.config.business_end_hour):
-            for minute in [0, 30]:
-                potential_starts.append(hour * 60 + minute)
+        # Create potential start times (every slot_granularity_minutes), as UTC minutes
+        potential_starts = range(window_open, window_close, self.config.slot_granularity_minutes)
         
         # Generate meetings
         for _ in range(num_meetings):
@@ -92,37 +99,27 @@ class RandomScheduleGenerator:
                 end_minutes = start_minutes + duration
                 
                 # Check if it fits in business hours
-                if end_minutes > (self.config.business_end_hour * 60):
+                if end_minutes > window_close:
                     attempts += 1
                     continue
                 
-                # Check for conflicts with existing slots
-                start_time = datetime.datetime.combine(
-                    date, 
-                    datetime.time(start_minutes // 60, start_minutes % 60)
-                )
-                end_time = datetime.datetime.combine(
-                    date, 
-                    datetime.time(end_minutes // 60, end_minutes % 60)
-                )
-                
                 # Check for overlap
                 has_conflict = False
                 for existing_start, existing_end in slots:
-                    if (start_time < existing_end and end_time > existing_start):
+                    if (start_minutes < existing_end and end_minutes > existing_start):
                         has_conflict = True
                         break
                 
                 if not has_conflict:
-                    slots.append((start_time, end_time))
+                    slots.append((start_minutes, end_minutes))
                     break
                 
                 attempts += 1
         
         return sorted(slots)
 
-    def _generate_appointment(self, start_time: datetime.datetime, end_time: datetime.datetime) -> Appointment:
-        """Generate a random appointment for the given time slot."""
+    def _generate_appointment(self, start_minute: int, end_minute: int) -> Appointment:
+        """Generate a random appointment for the given time slot (in UTC minutes)."""
         meeting_type = random.choice(self.meeting_types)
         client_name = random.choice(self.client_names)
         consultant_name = random.choice(self.consultant_names)
@@ -137,12 +134,15 @@ class RandomScheduleGenerator:
         title = f"{meeting_type}: {client_name}"
         description = random.choice(self.meeting_descriptions)
         
+        # Store times in the calendar's storage timezone, keeping the UTC minutes cached
         return Appointment(
             title=title,
-            start_time=start_time,
-            end_time=end_time,
+            start_time=from_minutes(start_minute, CALENDAR_CONFIG.timezone),
+            end_time=from_minutes(end_minute, CALENDAR_CONFIG.timezone),
             description=description,
-            attendees=attendees
+            attendees=attendees,
+            start_minute=start_minute,
+            end_minute=end_minute
         )
 
     def generate_schedule(self, start_date: datetime.date, end_date: datetime.date, 
@@ -159,9 +159,13 @@ class RandomScheduleGenerator:
             Dictionary mapping dates to lists of appointments
         """
         if clear_existing:
-            # Clear existing appointments in the date range
-            current_date = start_date
-            while current_date <= end_date:
+            # Clear existing appointments in the date range, widened to the storage dates
+            # the business hours can land on when they use another timezone
+            table = self._window_table()
+            first_start = from_minutes(table.window(start_date).start, CALENDAR_CONFIG.timezone)
+            last_start = from_minutes(table.window(end_date).end - 1, CALENDAR_CONFIG.timezone)
+            current_date = min(start_date, first_start.date())
+            while current_date <= max(end_date, last_start.date()):
                 if current_date in APPOINTMENTS_BY_DATE:
                     del APPOINTMENTS_BY_DATE[current_date]
                 current_date += datetime.timedelta(days=1)
@@ -180,18 +184,16 @@ class RandomScheduleGenerator:
                     # Generate time slots
                     time_slots = self._generate_meeting_time_slots(current_date, num_meetings)
                     
-                    # Create appointments
-                    appointments = []
-                    for start_time, end_time in time_slots:
-                        appointment = self._generate_appointment(start_time, end_time)
-                        appointments.append(appointment)
-                    
-                    if appointments:
-                        generated_schedule[current_date] = appointments
+                    # Create appointments, keyed by their start date in the storage timezone
+                    # (which can differ from current_date when the business hours use another timezone)
+                    for start_minute, end_minute in time_slots:
+                        appointment = self._generate_appointment(start_minute, end_minute)
+                        storage_date = appointment.start_time.date()
+                        generated_schedule.setdefault(storage_date, []).append(appointment)
                         # Also update the global calendar
-                        if current_date not in APPOINTMENTS_BY_DATE:
-                            APPOINTMENTS_BY_DATE[current_date] = []
-                        APPOINTMENTS_BY_DATE[current_date].extend(appointments)
+                        if storage_date not in APPOINTMENTS_BY_DATE:
+                            APPOINTMENTS_BY_DATE[storage_date] = []
+                        APPOINTMENTS_BY_DATE[storage_date].append(appointment)
             
             current_date += datetime.timedelta(days=1)
         
@@ -0,0 +1,205 @@
+"""
+Integer-minute time grid used by the calendar services.
+All scheduling arithmetic is done on minute offsets from the Unix epoch (UTC);
+datetimes are only built when parsing input and formatting output.
+"""
+
+import datetime
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+MINUTES_PER_DAY = 24 * 60
+EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+
+@lru_cache(maxsize=None)
+def get_zone(timezone: str) -> ZoneInfo:
+    """Get a (cached) ZoneInfo for a timezone name. Raises ZoneInfoNotFoundError if unknown or malformed."""
+    try:
+        return ZoneInfo(timezone)
+    except ValueError as e:
+        raise ZoneInfoNotFoundError(f"Invalid timezone key: {timezone!r}") from e
+
+
+def _wall_minutes(dt: datetime.datetime) -> int:
+    """Minutes from the epoch of a naive datetime's wall-clock reading, ignoring timezones."""
+    return (dt.toordinal() - EPOCH_ORDINAL) * MINUTES_PER_DAY + dt.hour * 60 + dt.minute
+
+
+def _offset_minutes(dt: datetime.datetime, timezone: str) -> int:
+    """UTC offset (in minutes) of a naive local datetime in the given timezone."""
+    return int(get_zone(timezone).utcoffset(dt).total_seconds()) // 60
+
+
+def to_minutes(dt: datetime.datetime, timezone: str) -> int:
+    """Convert a naive local datetime in `timezone` to UTC minutes from the epoch."""
+    return _wall_minutes(dt) - _offset_minutes(dt, timezone)
+
+
+def from_minutes(minutes: int, timezone: str) -> datetime.datetime:
+    """Convert UTC minutes from the epoch to a naive local datetime in `timezone`."""
+    utc = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc) + datetime.timedelta(minutes=minutes)
+    return utc.astimezone(get_zone(timezone)).replace(tzinfo=None)
+
+
+def format_minutes(minutes: int, offset: int) -> str:
+    """Format UTC minutes as 'YYYY-MM-DD HH:MM' local time, given a fixed UTC offset in minutes."""
+    days, minute_of_day = divmod(minutes + offset, MINUTES_PER_DAY)
+    hour, minute = divmod(minute_of_day, 60)
+    return f"{datetime.date.fromordinal(EPOCH_ORDINAL + days).isoformat()} {hour:02d}:{minute:02d}"
+
+
+def offset_at(minutes: int, timezone: str) -> int:
+    """UTC offset (in minutes) of `timezone` at the UTC instant `minutes`."""
+    return _wall_minutes(from_minutes(minutes, timezone)) - minutes
+
+
+def _offset_change(start: int, end: int, timezone: str, after: int) -> int:
+    """Bisect for the first UTC minute in [start, end] whose offset is `after` (the span's single change)."""
+    low, high = start, end
+    while low < high:
+        middle = (low + high) // 2
+        if offset_at(middle, timezone) == after:
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+def _offset_formatter(before: int, after: int, change: int) -> Callable[[int], str]:
+    """Build a formatter for UTC minutes whose offset switches from `before` to `after` at `change`."""
+    if before == after:
+        return lambda minutes: format_minutes(minutes, before)
+    return lambda minutes: format_minutes(minutes, before if minutes < change else after)
+
+
+def local_formatter(start: int, end: int, timezone: str) -> Callable[[int], str]:
+    """
+    Build a formatter for UTC minutes in [start, end] as 'YYYY-MM-DD HH:MM' local time.
+
+    The timezone database is consulted once per span rather than once per value.
+    A span may contain at most one UTC offset change (true for any single day);
+    its instant is located by bisection and every value is formatted arithmetically.
+    """
+    before = offset_at(start, timezone)
+    after = offset_at(end, timezone)
+    change = end if before == after else _offset_change(start, end, timezone, after)
+    return _offset_formatter(before, after, change)
+
+
+class WorkingWindow(NamedTuple):
+    """A working window in UTC minutes, with the timezone's UTC offsets across it."""
+    start: int
+    end: int
+    start_offset: int
+    end_offset: int
+    # First UTC minute with end_offset (equal to end when the offset does not change)
+    offset_change: int
+
+    def formatter(self) -> Callable[[int], str]:
+        """Build a formatter for UTC minutes inside the window as local 'YYYY-MM-DD HH:MM'."""
+        return _offset_formatter(self.start_offset, self.end_offset, self.offset_change)
+
+
+class WorkingWindowTable:
+    """
+    Per-timezone table of daily working windows in UTC minutes.
+    Each local date is resolved against the timezone database once, including
+    any DST change inside the window; after that, slot searches and formatting
+    in the table's own timezone are pure integer arithmetic.
+    """
+
+    def __init__(self, timezone: str, start_minute: int, end_minute: int):
+        get_zone(timezone)  # fail fast on unknown timezones
+        self.timezone = timezone
+        self.start_minute = start_minute
+        self.end_minute = end_minute
+        self._windows: Dict[int, WorkingWindow] = {}
+
+    def _resolve(self, date: datetime.date) -> WorkingWindow:
+        midnight = datetime.datetime.combine(date, datetime.time(0, 0))
+        open_local = midnight + datetime.timedelta(minutes=self.start_minute)
+        close_local = midnight + datetime.timedelta(minutes=self.end_minute)
+        start_offset = _offset_minutes(open_local, self.timezone)
+        end_offset = _offset_minutes(close_local, self.timezone)
+        start = _wall_minutes(open_local) - start_offset
+        end = _wall_minutes(close_local) - end_offset
+        if start_offset == end_offset:
+            offset_change = end
+        else:
+            offset_change = _offset_change(start, end, self.timezone, end_offset)
+        return WorkingWindow(start, end, start_offset, end_offset, offset_change)
+
+    def window(self, date: datetime.date) -> WorkingWindow:
+        """Get the working window for a local date."""
+        key = date.toordinal()
+        window = self._windows.get(key)
+        if window is None:
+            window = self._windows[key] = self._resolve(date)
+        return window
+
+
+@lru_cache(maxsize=None)
+def get_window_table(timezone: str, start_minute: int, end_minute: int) -> WorkingWindowTable:
+    """Get the shared working-window table for a timezone and local working hours."""
+    return WorkingWindowTable(timezone, start_minute, end_minute)
+
+
+def find_open_slots(window_open: int, window_close: int, busy: List[Tuple[int, int]],
+                    duration: int, step: int) -> List[int]:
+    """
+    Find the start minutes of every free slot inside a working window.
+
+    Candidate starts lie on a grid of `step` minutes anchored at `window_open`.
+    Busy intervals are swept once, and each free gap yields its starts as a
+    range, so a finer step only grows the output, not the number of conflict checks.
+
+    Args:
+        window_open: Window start in UTC minutes
+        window_close: Window end in UTC minutes
+        busy: Busy (start, end) intervals in UTC minutes, sorted by start
+        duration: Slot length in minutes
+        step: Grid step in minutes
+
+    Returns:
+        Sorted list of slot start times in UTC minutes
+    """
+    starts: List[int] = []
+    cursor = window_open
+    for busy_start, busy_end in busy:
+        if busy_start >= window_close:
+            break
+        if busy_end <= cursor:
+            continue
+        _extend_gap(starts, window_open, cursor, min(busy_start, window_close), duration, step)
+        cursor = busy_end
+    _extend_gap(starts, window_open, cursor, window_close, duration, step)
+    return starts
+
+
+def _extend_gap(starts: List[int], anchor: int, gap_start: int, gap_end: int,
+                duration: int, step: int):
+    """Append the grid-aligned starts of slots that fit in [gap_start, gap_end)."""
+    first = anchor + -(-(gap_start - anchor) // step) * step
+    starts.extend(range(first, gap_end - duration + 1, step))
+
+
+def is_aligned(minutes: int, anchor: int, step: int) -> bool:
+    """Check whether a time lies on the grid of `step` minutes anchored at `anchor`."""
+    return (minutes - anchor) % step == 0
+
+
+def storage_dates(start: int, end: int) -> List[datetime.date]:
+    """
+    Get the storage dates that can hold appointments overlapping the UTC minute interval [start, end].
+
+    Appointments are keyed by their local start date, which is within a day of
+    their UTC date in any timezone. An appointment (at most a day long) that
+    overlaps the interval starts at most a day before `start`, so the UTC dates
+    of [start - 1 day, end] padded by a day on each side cover every candidate
+    key without consulting the timezone database.
+    """
+    first = EPOCH_ORDINAL + (start - MINUTES_PER_DAY) // MINUTES_PER_DAY - 1
+    last = EPOCH_ORDINAL + end // MINUTES_PER_DAY + 1
+    return [datetime.date.fromordinal(ordinal) for ordinal in range(first, last + 1)]
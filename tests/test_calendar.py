@@ -0,0 +1,108 @@
+import datetime
+
+import pytest
+
+pytest.importorskip("crewai")
+
+from game_builder_crew.services import Calendar
+from game_builder_crew.shared.models import APPOINTMENTS_BY_DATE, CALENDAR_CONFIG, WorkingHours
+
+DATE = "2026-11-10"
+
+
+@pytest.fixture(autouse=True)
+def empty_calendar(monkeypatch):
+    saved = dict(APPOINTMENTS_BY_DATE)
+    APPOINTMENTS_BY_DATE.clear()
+    monkeypatch.setattr(CALENDAR_CONFIG, "consultant_hours", {
+        "Ann": WorkingHours("America/New_York", 9, 17),
+        "Ram": WorkingHours("Asia/Kathmandu", 9, 17),
+        "Lou": WorkingHours("America/Los_Angeles", 9, 17),
+        "Tak": WorkingHours("Asia/Tokyo", 9, 17),
+    })
+    yield
+    APPOINTMENTS_BY_DATE.clear()
+    APPOINTMENTS_BY_DATE.update(saved)
+
+
+def open_slots(*args, **kwargs):
+    return Calendar.get_open_meeting_slots.func(*args, **kwargs)
+
+
+def book(slot, attendees, **kwargs):
+    return Calendar.set_meeting.func(
+        "Review", slot["start_time"], slot["end_time"], "desc", attendees, **kwargs
+    )
+
+
+@pytest.mark.parametrize("consultant", ["Ann", "Ram"])
+def test_returned_slots_can_be_booked(consultant):
+    slots = open_slots(DATE, 60, consultant=consultant)
+    assert slots[0]["start_time"] == f"{DATE} 09:00"
+    assert slots[-1]["end_time"] == f"{DATE} 17:00"
+    assert all(slot["timezone"] == CALENDAR_CONFIG.consultant_hours[consultant].timezone for slot in slots)
+    
+    for slot in (slots[0], slots[-1]):
+        result = book(slot, [consultant])
+        assert result.get("success"), result
+    
+    remaining = open_slots(DATE, 60, consultant=consultant)
+    assert slots[0] not in remaining and slots[-1] not in remaining
+
+
+def test_returned_slots_can_be_booked_with_explicit_timezone():
+    slot = open_slots(DATE, 60, consultant="Ram", timezone="UTC")[0]
+    assert slot["start_time"] == f"{DATE} 03:15"
+    assert book(slot, ["Ram", "Ann"], timezone=slot["timezone"]).get("error")
+    assert book(slot, ["Ram"], timezone=slot["timezone"]).get("success")
+
+
+def test_booked_meeting_blocks_other_timezone():
+    assert book({"start_time": f"{DATE} 10:00", "end_time": f"{DATE} 11:00"}, ["Ann"])["success"]
+    utc_slots = open_slots(DATE, 60)
+    # 10:00-11:00 New York is 15:00-16:00 UTC
+    assert {"start_time": f"{DATE} 15:00", "end_time": f"{DATE} 16:00", "timezone": "UTC"} not in utc_slots
+    assert {"start_time": f"{DATE} 14:00", "end_time": f"{DATE} 15:00", "timezone": "UTC"} in utc_slots
+
+
+def test_clients_follow_consultant_hours():
+    slot = open_slots(DATE, 60, consultant="Ann")[-1]
+    assert slot["start_time"] == f"{DATE} 16:00"
+    assert book(slot, ["Ann", "John Doe"]).get("success")
+
+
+def test_business_hours_apply_without_consultant():
+    # 16:00-17:00 New York is 21:00-22:00 UTC
+    result = book({"start_time": f"{DATE} 16:00", "end_time": f"{DATE} 17:00"}, ["John Doe"],
+                  timezone="America/New_York")
+    assert "(UTC)" in result["error"]
+
+
+def test_meeting_crossing_storage_midnight_blocks_slots():
+    # 15:30-16:30 Los Angeles is 23:30-00:30 UTC, stored under the 10th
+    lou = {"start_time": f"{DATE} 15:30", "end_time": f"{DATE} 16:30"}
+    assert book(lou, ["Lou", "John Doe"])["success"]
+    assert list(APPOINTMENTS_BY_DATE) == [datetime.date(2026, 11, 10)]
+    
+    # 09:00-10:00 Tokyo on the 11th is 00:00-01:00 UTC
+    tak = {"start_time": "2026-11-11 09:00", "end_time": "2026-11-11 10:00"}
+    assert {**tak, "timezone": "Asia/Tokyo"} not in open_slots("2026-11-11", 60, consultant="Tak")
+    assert "conflicts" in book(tak, ["Tak", "Jane Smith"])["error"]
+
+
+@pytest.mark.parametrize("timezone", ["Mars/Olympus", "../etc"])
+def test_invalid_timezone_is_reported(timezone):
+    assert open_slots(DATE, 60, timezone=timezone) == {"error": f"Unknown timezone: {timezone}."}
+    slot = {"start_time": f"{DATE} 10:00", "end_time": f"{DATE} 11:00"}
+    assert book(slot, ["John Doe"], timezone=timezone) == {"error": f"Unknown timezone: {timezone}."}
+
+
+@pytest.mark.parametrize("step", [5, 15, 30])
+def test_granularity(monkeypatch, step):
+    monkeypatch.setattr(CALENDAR_CONFIG, "slot_granularity_minutes", step)
+    slots = open_slots(DATE, 60)
+    assert len(slots) == 7 * 60 // step + 1
+    
+    off_grid = datetime.time(9, step // 5 + 1).strftime("%H:%M")
+    result = book({"start_time": f"{DATE} {off_grid}", "end_time": f"{DATE} 11:00"}, ["John Doe"])
+    assert result["error"] == f"Meetings must start on the {step}-minute grid."
@@ -0,0 +1,84 @@
+import datetime
+import random
+
+import pytest
+
+from game_builder_crew.shared.models import (
+    APPOINTMENTS_BY_DATE,
+    CALENDAR_CONFIG,
+    ScheduleConfig,
+    WorkingHours,
+)
+from game_builder_crew.utils.schedule_generator import RandomScheduleGenerator
+from game_builder_crew.utils.time_grid import to_minutes
+
+
+@pytest.fixture(autouse=True)
+def empty_calendar():
+    saved = dict(APPOINTMENTS_BY_DATE)
+    APPOINTMENTS_BY_DATE.clear()
+    yield
+    APPOINTMENTS_BY_DATE.clear()
+    APPOINTMENTS_BY_DATE.update(saved)
+
+
+def test_appointments_keyed_by_storage_date():
+    random.seed(0)
+    config = ScheduleConfig(
+        daily_meeting_probability=1.0,
+        business_start_hour=16,
+        business_end_hour=17,
+        business_timezone="America/Los_Angeles",
+        meeting_durations=[30],
+        light_schedule_prob=0.0,
+        medium_schedule_prob=0.0,
+        heavy_schedule_prob=1.0,
+    )
+    day = datetime.date(2026, 11, 10)
+    schedule = RandomScheduleGenerator(config).generate_schedule(day, day)
+    
+    # 16:00-17:00 in Los Angeles is 00:00-01:00 UTC on the next day
+    assert list(schedule) == [datetime.date(2026, 11, 11)]
+    for date, apts in APPOINTMENTS_BY_DATE.items():
+        for apt in apts:
+            assert apt.start_time.date() == date
+            assert apt.start_minute == to_minutes(apt.start_time, CALENDAR_CONFIG.timezone)
+            assert apt.end_minute == to_minutes(apt.end_time, CALENDAR_CONFIG.timezone)
+
+
+def test_clear_existing_covers_spilled_storage_dates():
+    config = ScheduleConfig(
+        daily_meeting_probability=1.0,
+        business_start_hour=16,
+        business_end_hour=17,
+        business_timezone="America/Los_Angeles",
+        meeting_durations=[30],
+    )
+    day = datetime.date(2026, 11, 10)
+    generator = RandomScheduleGenerator(config)
+    generator.generate_schedule(day, day)
+    first = list(APPOINTMENTS_BY_DATE[datetime.date(2026, 11, 11)])
+    generator.generate_schedule(day, day, clear_existing=True)
+    assert not any(apt is old for old in first for apt in APPOINTMENTS_BY_DATE[datetime.date(2026, 11, 11)])
+
+
+def test_schedule_config_snapshots_calendar_settings(monkeypatch):
+    monkeypatch.setattr(CALENDAR_CONFIG, "business_hours", WorkingHours("Europe/Paris", 8, 16))
+    config = ScheduleConfig()
+    monkeypatch.setattr(CALENDAR_CONFIG, "business_hours", WorkingHours("Asia/Tokyo", 10, 18))
+    assert (config.business_timezone, config.business_start_hour, config.business_end_hour) == (
+        "Europe/Paris", 8, 16
+    )
+
+
+@pytest.mark.parametrize("start_hour, end_hour", [(17, 9), (9, 9), (-1, 17), (9, 25)])
+def test_invalid_working_hours(start_hour, end_hour):
+    with pytest.raises(ValueError):
+        WorkingHours("UTC", start_hour, end_hour)
+    with pytest.raises(ValueError):
+        ScheduleConfig(business_start_hour=start_hour, business_end_hour=end_hour)
+
+
+def test_invalid_granularity():
+    with pytest.raises(ValueError):
+        ScheduleConfig(slot_granularity_minutes=7)
@@ -0,0 +1,108 @@
+import datetime
+
+import pytest
+
+from zoneinfo import ZoneInfoNotFoundError
+
+from game_builder_crew.utils.time_grid import (
+    MINUTES_PER_DAY,
+    find_open_slots,
+    format_minutes,
+    from_minutes,
+    get_window_table,
+    get_zone,
+    local_formatter,
+    storage_dates,
+    to_minutes,
+)
+
+
+def utc_minutes(*args):
+    return to_minutes(datetime.datetime(*args), "UTC")
+
+
+def test_to_minutes_round_trip():
+    local = datetime.datetime(2026, 7, 1, 9, 15)
+    minutes = to_minutes(local, "America/New_York")
+    assert minutes == utc_minutes(2026, 7, 1, 13, 15)
+    assert from_minutes(minutes, "America/New_York") == local
+    assert format_minutes(minutes, -240) == "2026-07-01 09:15"
+
+
+def test_to_minutes_nonexistent_local_time():
+    # 02:30 does not exist in New York on 2026-03-08; it resolves with the pre-transition offset
+    minutes = to_minutes(datetime.datetime(2026, 3, 8, 2, 30), "America/New_York")
+    assert minutes == utc_minutes(2026, 3, 8, 7, 30)
+    assert from_minutes(minutes, "America/New_York") == datetime.datetime(2026, 3, 8, 3, 30)
+
+
+@pytest.mark.parametrize("date, length, offsets", [
+    (datetime.date(2026, 3, 8), 23 * 60, (-300, -240)),
+    (datetime.date(2026, 11, 1), 25 * 60, (-240, -300)),
+    (datetime.date(2026, 7, 1), 24 * 60, (-240, -240)),
+])
+def test_window_on_dst_transition_day(date, length, offsets):
+    window = get_window_table("America/New_York", 0, 24 * 60).window(date)
+    assert window.end - window.start == length
+    assert (window.start_offset, window.end_offset) == offsets
+
+
+def test_window_offset_change():
+    window = get_window_table("America/New_York", 0, 24 * 60).window(datetime.date(2026, 3, 8))
+    assert window.offset_change == utc_minutes(2026, 3, 8, 7, 0)
+    
+    summer = get_window_table("America/New_York", 9 * 60, 17 * 60).window(datetime.date(2026, 7, 1))
+    assert summer.offset_change == summer.end
+
+
+@pytest.mark.parametrize("use_table", [True, False])
+def test_formatter_across_dst_change(use_table):
+    window = get_window_table("America/New_York", 0, 24 * 60).window(datetime.date(2026, 3, 8))
+    if use_table:
+        format_local = window.formatter()
+    else:
+        format_local = local_formatter(window.start, window.end, "America/New_York")
+    assert format_local(utc_minutes(2026, 3, 8, 6, 59)) == "2026-03-08 01:59"
+    assert format_local(utc_minutes(2026, 3, 8, 7, 0)) == "2026-03-08 03:00"
+    assert format_local(window.end) == "2026-03-09 00:00"
+
+
+@pytest.mark.parametrize("timezone", ["Mars/Olympus", "../etc", ""])
+def test_get_zone_rejects_invalid_keys(timezone):
+    with pytest.raises(ZoneInfoNotFoundError):
+        get_zone(timezone)
+
+
+def test_find_open_slots_overlapping_busy_intervals():
+    busy = [(60, 180), (90, 120), (150, 240)]
+    assert find_open_slots(0, 480, busy, 60, 30) == [0, 240, 270, 300, 330, 360, 390, 420]
+
+
+def test_find_open_slots_contained_busy_interval():
+    busy = [(60, 300), (100, 200), (290, 340)]
+    assert find_open_slots(0, 480, busy, 60, 30) == [0, 360, 390, 420]
+
+
+def test_find_open_slots_aligns_to_window_open():
+    # Busy interval ending off-grid pushes the next start up to the grid
+    assert find_open_slots(45, 285, [(45, 110)], 60, 30) == [135, 165, 195, 225]
+
+
+@pytest.mark.parametrize("step", [5, 15, 30])
+def test_find_open_slots_steps(step):
+    starts = find_open_slots(540, 1020, [(600, 660)], 60, step)
+    assert starts[0] == 540
+    assert all(b - a == step for a, b in zip(starts, starts[1:]) if b < 660)
+    assert all(start + 60 <= 600 or start >= 660 for start in starts)
+    assert starts[-1] == 960
+    assert len(starts) == (600 - 60 - 540) // step + 1 + (960 - 660) // step + 1
+
+
+@pytest.mark.parametrize("timezone", ["UTC", "Asia/Tokyo", "Pacific/Kiritimati", "Pacific/Pago_Pago"])
+def test_storage_dates_cover_appointments_crossing_midnight(timezone):
+    # Any appointment overlapping [start, end] starts within a day before start
+    start = utc_minutes(2026, 11, 11, 0, 0)
+    end = start + 60
+    dates = storage_dates(start, end)
+    for minutes in (start - MINUTES_PER_DAY + 1, start - 30, start, end):
+        assert from_minutes(minutes, timezone).date() in dates